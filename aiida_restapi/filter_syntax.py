@@ -8,6 +8,7 @@ https://github.com/Materials-Consortia/OPTIMADE/blob/master/optimade.rst#the-fil
 """
 
 # pylint: disable=too-many-branches
+from functools import lru_cache
 from importlib import resources
 from typing import Any, Callable, Dict, List, Optional, Union
 
@@ -20,6 +21,9 @@ FILTER_GRAMMAR = resources.open_text(static, 'filter_grammar.lark')
 
 FILTER_PARSER = Lark(FILTER_GRAMMAR, start='filter')
 
+FILTER_CACHE_SIZE = 256
+"""The maximum number of distinct filter strings whose parse trees are cached."""
+
 _converters: Dict[str, Callable[[str], Any]] = {
     'FLOAT': float,
     'STRING': lambda s: s[1:-1],
@@ -50,13 +54,23 @@ def _parse_valuelist(valuelist: Tree) -> List[Union[int, float, str]]:
     return output
 
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _parse_tree(string: str) -> Tree:
+    """Parse a filter string to a ``lark`` tree.
+
+    The parse is the expensive step, and the same filter strings tend to be sent repeatedly,
+    so the (read-only) trees are memoized. Failed parses are not cached.
+    """
+    return FILTER_PARSER.parse(string)
+
+
 def parse_filter_str(string: Optional[str]) -> Dict[str, Any]:
     """Parse a filter string to a list of ``QueryBuilder`` compliant operators."""
     filters: Dict[str, Any] = {}
     if not string:
         return filters
     try:
-        tree = FILTER_PARSER.parse(string)
+        tree = _parse_tree(string)
     except Exception as err:
         raise ValueError(f'Malformed filter string: {err}') from err
 
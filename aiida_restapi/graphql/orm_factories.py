@@ -17,16 +17,28 @@ from aiida_restapi.aiida_db_mappings import ORM_MAPPING, get_model_from_orm
 from .config import ENTITY_LIMIT
 from .utils import JSON, selected_field_names_naive
 
-_type_mapping = {
-    int: gr.Int,
-    float: gr.Float,
-    str: gr.String,
-    bool: gr.Boolean,
-    datetime: gr.DateTime,
-    UUID: gr.ID,
-    Json: JSON,
-    Any: JSON,
-}
+# ordered by frequency of use in the database models, since lookup is a linear identity scan
+_TYPE_PAIRS = (
+    (int, gr.Int),
+    (str, gr.String),
+    (datetime, gr.DateTime),
+    (UUID, gr.ID),
+    (Json, JSON),
+    (bool, gr.Boolean),
+    (float, gr.Float),
+    (Any, JSON),
+)
+
+
+def get_graphene_type(field_type: Any) -> Type[gr.Scalar]:
+    """Return the graphene type corresponding to a python type.
+
+    :raises KeyError: if the type has no graphene mapping
+    """
+    for py_type, gr_type in _TYPE_PAIRS:
+        if field_type is py_type:
+            return gr_type
+    raise KeyError(field_type)
 
 
 def get_pydantic_type_name(annotation: Any) -> Any:
@@ -47,8 +59,7 @@ def fields_from_orm(cls: Type[orm.Entity], exclude_fields: Sequence[str] = ()) -
     for name, field in get_model_from_orm(cls).model_fields.items():
         if name in exclude_fields:
             continue
-        field_type = get_pydantic_type_name(field.annotation)
-        gr_type = _type_mapping[field_type]
+        gr_type = get_graphene_type(get_pydantic_type_name(field.annotation))
         output[name] = gr_type(description=field.description)
     return output
 
@@ -59,8 +70,7 @@ def fields_from_name(cls: str, exclude_fields: Sequence[str] = ()) -> Dict[str,
     for name, field in ORM_MAPPING[cls].model_fields.items():
         if name in exclude_fields:
             continue
-        field_type = get_pydantic_type_name(field.annotation)
-        gr_type = _type_mapping[field_type]
+        gr_type = get_graphene_type(get_pydantic_type_name(field.annotation))
         output[name] = gr_type(description=field.description)
     return output
 
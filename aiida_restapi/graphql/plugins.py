@@ -24,13 +24,14 @@ def create_query(queries: Sequence[QueryPlugin], docstring: str = 'The root quer
     # construct the dict of attributes/methods on the class
     attr_map: Dict[str, Union[gr.ObjectType, ResolverType]] = {}
     for query in queries:
-        if query.name.startswith('resolve_'):
+        name, field, resolver = query
+        if name.startswith('resolve_'):
             raise ValueError('Plugin name cannot')
-        if query.name in name_map:
-            raise ValueError(f"Duplicate plugin name '{query.name}': {query} and {name_map[query.name]}")
-        name_map[query.name] = query
-        attr_map[query.name] = query.field
-        attr_map[f'resolve_{query.name}'] = query.resolver
+        if name in name_map:
+            raise ValueError(f"Duplicate plugin name '{name}': {query} and {name_map[name]}")
+        name_map[name] = query
+        attr_map[name] = field
+        attr_map[f'resolve_{name}'] = resolver
     attr_map['__doc__'] = docstring
     return type('RootQuery', (gr.ObjectType,), attr_map)
 
@@ -1,6 +1,7 @@
 """Sphinx extension for documenting the GraphQL schema."""
 
 # pylint: disable=import-outside-toplevel
+from functools import lru_cache
 from typing import TYPE_CHECKING, List
 
 from graphql.utilities import print_schema
@@ -11,6 +12,15 @@ if TYPE_CHECKING:
     from sphinx.application import Sphinx
 
 
+@lru_cache(maxsize=None)
+def get_printed_schema() -> str:
+    """Return the printed GraphQL schema.
+
+    The schema is fixed at import time, so it is only printed once per build.
+    """
+    return print_schema(SCHEMA.graphql_schema)
+
+
 def setup(app: 'Sphinx') -> None:
     """Setup the sphinx extension."""
     from docutils.nodes import Element, literal_block
@@ -21,7 +31,7 @@ def setup(app: 'Sphinx') -> None:
 
         def run(self) -> List[Element]:
             """Run the directive."""
-            text = print_schema(SCHEMA.graphql_schema)
+            text = get_printed_schema()
             # TODO for lexing tried: https://gitlab.com/marcogiusti/pygments-graphql/-/blob/master/src/pygments_graphql.py
             # but it failed
             code_node = literal_block(text, text)  # , language="graphql")
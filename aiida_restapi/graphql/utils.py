@@ -1,7 +1,7 @@
 """Utility functions for graphql."""
 # pylint: disable=unused-argument,too-many-arguments
 
-from typing import Iterator
+from typing import List
 
 import graphene as gr
 from graphene.types.scalars import Scalar
@@ -19,20 +19,21 @@ class FilterString(gr.String):
     """A string adhering to the AiiDA filter syntax."""
 
 
-def selected_field_names_naive(selection_set: ast.SelectionSetNode) -> Iterator[str]:
+def selected_field_names_naive(selection_set: ast.SelectionSetNode) -> List[str]:
     """Get the list of field names that are selected at the current level.
     Does not include nested names.
 
     Taken from: https://github.com/graphql-python/graphene/issues/57#issuecomment-774227086
     """
-    assert isinstance(selection_set, ast.SelectionSetNode)
+    selections = selection_set.selections
+    names = [node.name.value for node in selections if isinstance(node, ast.FieldNode)]
+    if len(names) == len(selections):
+        return names
 
-    for node in selection_set.selections:
-        # Field
-        if isinstance(node, ast.FieldNode):
-            yield node.name.value
+    for node in selections:
         # Fragment spread (`... fragmentName`)
-        elif isinstance(node, (ast.FragmentSpreadNode, ast.InlineFragmentNode)):
+        if isinstance(node, (ast.FragmentSpreadNode, ast.InlineFragmentNode)):
             raise NotImplementedError('Fragments are not supported by this simplistic function')
-        else:
+        if not isinstance(node, ast.FieldNode):
             raise NotImplementedError(str(type(node)))
+    return names
@@ -31,14 +31,41 @@ Examples of invalid full types:
 
 """
 
-from typing import Any
+import re
+from functools import lru_cache
+from typing import Any, Tuple
 
+from aiida.common import EntryPointError
 from aiida.common.escaping import escape_for_sql_like
+from aiida.common.lang import type_check
+from aiida.common.utils import strip_prefix
+from aiida.plugins.entry_point import (
+    is_valid_entry_point_string,
+    load_entry_point,
+    load_entry_point_from_string,
+)
 
 FULL_TYPE_CONCATENATOR = '|'
 LIKE_OPERATOR_CHARACTER = '%'
 DEFAULT_NAMESPACE_LABEL = '~no-entry-point~'
 
+# Two segments joined by the concatenator, each optionally terminated by a single like-operator character
+_FULL_TYPE_REGEX = re.compile(
+    '([^{concatenator}{like}]*{like}?){concatenator}([^{concatenator}{like}]*{like}?)'.format(
+        concatenator=re.escape(FULL_TYPE_CONCATENATOR), like=re.escape(LIKE_OPERATOR_CHARACTER)
+    )
+)
+
+# Characters that are escaped by `escape_for_sql_like`
+_SQL_LIKE_SPECIAL_CHARACTERS = re.compile(r'[\\%_]')
+
+
+def _escape_for_sql_like(string: str) -> str:
+    """Escape the string for use in a SQL `LIKE` expression, skipping the call if there is nothing to escape."""
+    if _SQL_LIKE_SPECIAL_CHARACTERS.search(string) is None:
+        return string
+    return escape_for_sql_like(string)
+
 
 def validate_full_type(full_type: str) -> None:
     """Validate that the `full_type` is a valid full type unique node identifier.
@@ -47,19 +74,71 @@ def validate_full_type(full_type: str) -> None:
     :raises ValueError: if the `full_type` is invalid
     :raises TypeError: if the `full_type` is not a string type
     """
-    from aiida.common.lang import type_check
+    validate_and_split_full_type(full_type)
+
+
+def validate_and_split_full_type(full_type: str) -> Tuple[str, str]:
+    """Validate the `full_type` and split it into its `node_type` and `process_type` segments.
 
+    :param full_type: a `Node` full type
+    :return: tuple of the `node_type` and `process_type` segments
+    :raises ValueError: if the `full_type` is invalid
+    :raises TypeError: if the `full_type` is not a string type
+    """
     type_check(full_type, str)
 
-    if FULL_TYPE_CONCATENATOR not in full_type:
+    node_type, concatenator, process_type = full_type.partition(FULL_TYPE_CONCATENATOR)
+
+    if not concatenator:
         raise ValueError(
             f'full type `{full_type}` does not include the required concatenator symbol `{FULL_TYPE_CONCATENATOR}`.'
         )
-    elif full_type.count(FULL_TYPE_CONCATENATOR) > 1:
+    elif FULL_TYPE_CONCATENATOR in process_type:
         raise ValueError(
             f'full type `{full_type}` includes the concatenator symbol `{FULL_TYPE_CONCATENATOR}` more than once.'
         )
 
+    return node_type, process_type
+
+
+def _split_full_type(full_type: str) -> Tuple[str, str]:
+    """Validate the `full_type`, including its like-operator characters, and split it into its segments.
+
+    Valid full types are matched with a single regular expression. Only if that fails are the individual checks of
+    `_validate_and_split_segments` run, to raise the appropriate exception.
+
+    :param full_type: a `Node` full type
+    :return: tuple of the `node_type` and `process_type` segments
+    :raises ValueError: if the `full_type` is invalid
+    :raises TypeError: if the `full_type` is not a string type
+    """
+    match = _FULL_TYPE_REGEX.fullmatch(full_type) if isinstance(full_type, str) else None
+
+    if match is None:
+        return _validate_and_split_segments(full_type)
+
+    return match.group(1), match.group(2)
+
+
+def _validate_and_split_segments(full_type: str) -> Tuple[str, str]:
+    """Validate the `full_type` with individual checks, including its like-operator characters, and split it.
+
+    :param full_type: a `Node` full type
+    :return: tuple of the `node_type` and `process_type` segments
+    :raises ValueError: if the `full_type` is invalid
+    :raises TypeError: if the `full_type` is not a string type
+    """
+    node_type, process_type = validate_and_split_full_type(full_type)
+
+    for entry in (node_type, process_type):
+        if entry.count(LIKE_OPERATOR_CHARACTER) > 1:
+            raise ValueError(f'full type component `{entry}` contained more than one like-operator character')
+
+        if LIKE_OPERATOR_CHARACTER in entry and entry[-1] != LIKE_OPERATOR_CHARACTER:
+            raise ValueError(f'like-operator character in full type component `{entry}` is not at the end')
+
+    return node_type, process_type
+
 
 def construct_full_type(node_type: str, process_type: str) -> str:
     """Return the full type, which fully identifies the type of any `Node` with the given `node_type` and
@@ -86,22 +165,14 @@ def get_full_type_filters(full_type: str) -> dict[str, Any]:
     :raises ValueError: if the `full_type` is invalid
     :raises TypeError: if the `full_type` is not a string type
     """
-    validate_full_type(full_type)
+    node_type, process_type = _split_full_type(full_type)
 
     filters: dict[str, Any] = {}
-    node_type, process_type = full_type.split(FULL_TYPE_CONCATENATOR)
-
-    for entry in (node_type, process_type):
-        if entry.count(LIKE_OPERATOR_CHARACTER) > 1:
-            raise ValueError(f'full type component `{entry}` contained more than one like-operator character')
-
-        if LIKE_OPERATOR_CHARACTER in entry and entry[-1] != LIKE_OPERATOR_CHARACTER:
-            raise ValueError(f'like-operator character in full type component `{entry}` is not at the end')
 
     if LIKE_OPERATOR_CHARACTER in node_type:
         # Remove the trailing `LIKE_OPERATOR_CHARACTER`, escape the string and reattach the character
         node_type = node_type[:-1]
-        node_type = escape_for_sql_like(node_type) + LIKE_OPERATOR_CHARACTER
+        node_type = _escape_for_sql_like(node_type) + LIKE_OPERATOR_CHARACTER
         filters['node_type'] = {'like': node_type}
     else:
         filters['node_type'] = {'==': node_type}
@@ -112,7 +183,7 @@ def get_full_type_filters(full_type: str) -> dict[str, Any]:
         # If there was more: escape the string and reattach the character
         process_type = process_type[:-1]
         if process_type:
-            process_type = escape_for_sql_like(process_type) + LIKE_OPERATOR_CHARACTER
+            process_type = _escape_for_sql_like(process_type) + LIKE_OPERATOR_CHARACTER
             filters['process_type'] = {'like': process_type}
     elif process_type:
         filters['process_type'] = {'==': process_type}
@@ -127,27 +198,20 @@ def get_full_type_filters(full_type: str) -> dict[str, Any]:
     return filters
 
 
+@lru_cache(maxsize=512)
 def load_entry_point_from_full_type(full_type: str) -> Any:
     """Return the loaded entry point for the given `full_type` unique node type identifier.
 
+    The loaded entry points are cached, failures to load them are not.
+
     :param full_type: the `full_type` unique node type identifier
     :raises ValueError: if the `full_type` is invalid
     :raises TypeError: if the `full_type` is not a string type
     :raises `~aiida.common.exceptions.EntryPointError`: if the corresponding entry point cannot be loaded
     """
-    from aiida.common import EntryPointError
-    from aiida.common.utils import strip_prefix
-    from aiida.plugins.entry_point import (
-        is_valid_entry_point_string,
-        load_entry_point,
-        load_entry_point_from_string,
-    )
-
     data_prefix = 'data.'
 
-    validate_full_type(full_type)
-
-    node_type, process_type = full_type.split(FULL_TYPE_CONCATENATOR)
+    node_type, process_type = validate_and_split_full_type(full_type)
 
     if is_valid_entry_point_string(process_type):
         try:
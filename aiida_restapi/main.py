@@ -1,16 +1,39 @@
 """Declaration of FastAPI application."""
 
+from typing import Any
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from aiida_restapi.graphql import main
 from aiida_restapi.routers import auth, computers, daemon, groups, nodes, process, users
 
-app = FastAPI()
-app.include_router(auth.router)
-app.include_router(computers.router)
-app.include_router(daemon.router)
-app.include_router(nodes.router)
-app.include_router(groups.router)
-app.include_router(users.router)
-app.include_router(process.router)
+
+class AiidaJSONResponse(ORJSONResponse):
+    """JSON response encoded with orjson, falling back to the standard library for unsupported content.
+
+    orjson cannot encode integers wider than 64 bits, which AiiDA node attributes may contain.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode the content with orjson, or with the standard library ``json`` if orjson rejects it."""
+        try:
+            return super().render(content)
+        except TypeError:
+            return JSONResponse.render(self, content)
+
+
+ROUTERS = (
+    auth.router,
+    computers.router,
+    daemon.router,
+    nodes.router,
+    groups.router,
+    users.router,
+    process.router,
+)
+
+app = FastAPI(default_response_class=AiidaJSONResponse)
+for router in ROUTERS:
+    app.include_router(router)
 app.add_route('/graphql', main.app, name='graphql')
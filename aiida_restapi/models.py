@@ -7,13 +7,15 @@ Models in this module mirror those in
 
 import inspect
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, ClassVar, Dict, List, Optional, Type, TypeVar
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Sequence, Tuple, Type, TypeVar, cast
 from uuid import UUID
 
 from aiida import orm
+from aiida.manage import get_manager
 from fastapi import Form
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 # Template type for subclasses of `AiidaModel`
 ModelType = TypeVar('ModelType', bound='AiidaModel')
@@ -41,9 +43,7 @@ def as_form(cls: Type[BaseModel]) -> Type[BaseModel]:
     async def as_form_func(**data: Dict[str, Any]) -> Any:
         return cls(**data)
 
-    sig = inspect.signature(as_form_func)
-    sig = sig.replace(parameters=new_parameters)
-    as_form_func.__signature__ = sig  # type: ignore
+    as_form_func.__signature__ = inspect.Signature(parameters=new_parameters)  # type: ignore
     setattr(cls, 'as_form', as_form_func)
     return cls
 
@@ -52,12 +52,45 @@ class AiidaModel(BaseModel):
     """A mapping of an AiiDA entity to a pydantic model."""
 
     _orm_entity: ClassVar[Type[orm.entities.Entity]] = orm.entities.Entity
-    model_config = ConfigDict(from_attributes=True, extra='forbid')
+    # Models whose field types match those returned by the ``QueryBuilder`` can skip validating database rows
+    _validate_db_rows: ClassVar[bool] = True
+    # Core schemas are only built once a model is first used for validation or serialization.
+    # Instances are never modified once built, whether read from the database or parsed from a request body, so all
+    # models are frozen.
+    model_config = ConfigDict(from_attributes=True, extra='forbid', defer_build=True, frozen=True)
 
     @classmethod
     def get_projectable_properties(cls) -> List[str]:
         """Return projectable properties."""
-        return list(cls.schema()['properties'].keys())
+        return list(cls._get_projectable_properties())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_projectable_properties(cls) -> Tuple[str, ...]:
+        """Return projectable properties, computed once per class.
+
+        These are the model fields, read directly rather than from the JSON schema, so the deferred core schema is
+        not built just to list them.
+        """
+        return tuple(cls.model_fields.keys())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_projectable_properties_set(cls) -> FrozenSet[str]:
+        """Return projectable properties as a set, for validating projections."""
+        return frozenset(cls._get_projectable_properties())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_required_properties_set(cls) -> FrozenSet[str]:
+        """Return the properties without a default, which a projection must include to skip validation."""
+        return frozenset(name for name, field in cls.model_fields.items() if field.is_required())
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_list_adapter(cls: Type[ModelType]) -> TypeAdapter[List[ModelType]]:
+        """Return an adapter validating a list of entities in a single call, built once per class."""
+        return TypeAdapter(List[cls])  # type: ignore[valid-type]
 
     @classmethod
     def get_entities(
@@ -65,37 +98,53 @@ class AiidaModel(BaseModel):
         *,
         page_size: Optional[int] = None,
         page: int = 0,
-        project: Optional[List[str]] = None,
-        order_by: Optional[List[str]] = None,
+        project: Optional[Sequence[str]] = None,
+        order_by: Optional[Sequence[str]] = None,
+        after_id: Optional[int] = None,
     ) -> List[ModelType]:
         """Return a list of entities (with pagination).
 
         :param project: properties to project (default: all available)
         :param page_size: the page size (default: infinite)
-        :param page: the page to return, if page_size set
+        :param page: the page to return, if page_size set (cannot be combined with ``after_id``)
+        :param after_id: only return entities with an id greater than this, ordered by id. This replaces ``page`` to
+            paginate large tables, since the database does not have to scan all preceding rows. Cannot be combined
+            with ``page`` or ``order_by``.
         """
+        projectable = cls._get_projectable_properties_set()
         if project is None:
-            project = cls.get_projectable_properties()
-        else:
-            assert set(cls.get_projectable_properties()).issuperset(
-                project
-            ), f'projection not subset of projectable properties: {project!r}'
-        query = orm.QueryBuilder().append(cls._orm_entity, tag='fields', project=project)
+            project = cls._get_projectable_properties()
+        elif not projectable.issuperset(project):
+            raise ValueError(f'projection not subset of projectable properties: {project!r}')
+        if order_by is not None and not projectable.issuperset(order_by):
+            raise ValueError(f'order_by not subset of projectable properties: {order_by!r}')
+        if after_id is not None and order_by is not None:
+            raise ValueError('after_id cannot be combined with order_by')
+        if after_id is not None and page != 0:
+            raise ValueError('after_id cannot be combined with page')
+        filters = None if after_id is None else {'id': {'>': after_id}}
+        query = orm.QueryBuilder().append(cls._orm_entity, tag='fields', filters=filters, project=list(project))
         if page_size is not None:
-            query.offset(page_size * (page - 1))
+            if after_id is None:
+                query.offset(page_size * (page - 1))
             query.limit(page_size)
         if order_by is not None:
-            assert set(cls.get_projectable_properties()).issuperset(
-                order_by
-            ), f'order_by not subset of projectable properties: {project!r}'
-            query.order_by({'fields': order_by})
-        return [cls(**result['fields']) for result in query.dict()]
+            query.order_by({'fields': list(order_by)})
+        elif after_id is not None:
+            query.order_by({'fields': 'id'})
+        # Rows are streamed as tuples in projection order, avoiding a nested dictionary per row
+        # A partial projection may miss required fields, which only validation reports
+        if cls._validate_db_rows or not cls._get_required_properties_set().issubset(project):
+            return cls._get_list_adapter().validate_python(dict(zip(project, row)) for row in query.iterall())
+        # mypy infers ``model_construct`` on ``cls`` as returning the base model rather than ``ModelType``
+        return cast(List[ModelType], [cls.model_construct(**dict(zip(project, row))) for row in query.iterall()])
 
 
 class Comment(AiidaModel):
     """AiiDA Comment model."""
 
     _orm_entity = orm.Comment
+    _validate_db_rows = False
 
     id: Optional[int] = Field(None, description='Unique comment id (pk)')
     uuid: str = Field(description='Unique comment uuid')
@@ -110,6 +159,7 @@ class User(AiidaModel):
     """AiiDA User model."""
 
     _orm_entity = orm.User
+    _validate_db_rows = False
     model_config = ConfigDict(extra='allow')
 
     id: Optional[int] = Field(None, description='Unique user id (pk)')
@@ -123,6 +173,7 @@ class Computer(AiidaModel):
     """AiiDA Computer Model."""
 
     _orm_entity = orm.Computer
+    _validate_db_rows = False
 
     id: Optional[int] = Field(None, description='Unique computer id (pk)')
     uuid: Optional[str] = Field(None, description='Unique id for computer')
@@ -236,6 +287,19 @@ class Node_Post(AiidaModel):
         orm_object.store()
         return orm_object
 
+    @classmethod
+    def create_new_nodes(
+        cls: Type['Node_Post'],
+        orm_class: orm.Node,
+        node_dicts: List[dict],
+    ) -> List[orm.Node]:
+        """Create and Store new Nodes in a single transaction
+
+        Either all nodes are stored, or none of them are if one fails.
+        """
+        with get_manager().get_profile_storage().transaction():
+            return [cls.create_new_node(orm_class, node_dict) for node_dict in node_dicts]
+
     @classmethod
     def create_new_node_with_file(
         cls: Type[ModelType],
@@ -288,8 +352,7 @@ class Group(AiidaModel):
             )
             .limit(1)
         )
-        orm_entity.user_id = query.dict()[0]['fields']['user_id']
-        orm_entity.time = query.dict()[0]['fields']['time']
+        orm_entity.user_id, orm_entity.time = query.first()
 
         return super().from_orm(orm_entity)
 
@@ -20,6 +20,9 @@ from .auth import get_current_active_user
 
 router = APIRouter()
 
+# Size in bytes of the chunks in which uploaded files are copied to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 @router.get('/nodes', response_model=List[models.Node])
 @with_dbenv()
@@ -161,9 +164,9 @@ async def create_upload_file(
         ) from exception
 
     with tempfile.NamedTemporaryFile(mode='wb', delete=False) as temp_file:
-        # Todo: read in chunks
-        content = await upload_file.read()
-        temp_file.write(content)
+        # Copy in chunks so the whole upload is never held in memory
+        while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+            temp_file.write(chunk)
         temp_path = temp_file.name
 
     orm_object = models.Node_Post.create_new_node_with_file(cls, node_dict, Path(temp_path))
@@ -4,7 +4,12 @@ import datetime
 
 from dateutil.parser import parser as date_parser
 
+_DATE_PARSER = date_parser()
+
 
 def parse_date(string: str) -> datetime.datetime:
     """Parse any date/time stamp string."""
-    return date_parser().parse(string)
+    try:
+        return datetime.datetime.fromisoformat(string)
+    except ValueError:
+        return _DATE_PARSER.parse(string)
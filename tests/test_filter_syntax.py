@@ -4,7 +4,7 @@ import datetime
 
 import pytest
 
-from aiida_restapi.filter_syntax import parse_filter_str
+from aiida_restapi.filter_syntax import _parse_tree, parse_filter_str
 
 
 @pytest.mark.parametrize(
@@ -35,3 +35,16 @@ from aiida_restapi.filter_syntax import parse_filter_str
 def test_parser(input_str, output):
     """Test correct parsing"""
     assert parse_filter_str(input_str) == output
+
+
+def test_parser_repeated():
+    """Test that repeated parses of the same string reuse the cached tree but return independent filters."""
+    _parse_tree.cache_clear()
+    first = parse_filter_str('a IN 1,2')
+    hits = _parse_tree.cache_info().hits
+    first['user_id'] = 1
+    first['a']['in'].append(3)
+
+    second = parse_filter_str('a IN 1,2')
+    assert _parse_tree.cache_info().hits == hits + 1
+    assert second == {'a': {'in': [1, 2]}}
@@ -0,0 +1,64 @@
+"""Test the node full type utilities."""
+
+import pytest
+
+from aiida_restapi import identifiers
+
+
+@pytest.mark.parametrize(
+    'full_type',
+    [
+        'data.bool.Bool.|',
+        'process.calculation.calcfunction.%|%',
+        'process.calculation.calcjob.CalcJobNode.|aiida.calculations:arithmetic.add',
+        'process.%|aiida.workflows:codtools%',
+        '|',
+        '%|%',
+    ],
+)
+def test_split_full_type_valid(full_type):
+    """Test the regular expression splits valid full types like the individual checks."""
+    match = identifiers._FULL_TYPE_REGEX.fullmatch(full_type)  # pylint: disable=protected-access
+
+    assert match is not None
+    assert match.groups() == identifiers._validate_and_split_segments(full_type)  # pylint: disable=protected-access
+    assert identifiers._split_full_type(full_type) == match.groups()  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    'full_type, message',
+    [
+        ('data.bool', 'does not include the required concatenator symbol'),
+        ('data.|bool.Bool.|process.', 'concatenator symbol `\\|` more than once'),
+        ('process.calculation%.calcfunction.|aiida', 'is not at the end'),
+        ('process.calculation%.calcfunction.%|aiida', 'contained more than one like-operator character'),
+    ],
+)
+def test_split_full_type_invalid(full_type, message):
+    """Test invalid full types are not matched by the regular expression and raise the original errors."""
+    assert identifiers._FULL_TYPE_REGEX.fullmatch(full_type) is None  # pylint: disable=protected-access
+
+    with pytest.raises(ValueError, match=message):
+        identifiers.get_full_type_filters(full_type)
+
+
+def test_split_full_type_not_string():
+    """Test a full type that is not a string raises ``TypeError``."""
+    with pytest.raises(TypeError):
+        identifiers.get_full_type_filters(None)
+
+
+def test_get_full_type_filters_copy():
+    """Test modifying the returned filters does not affect later calls."""
+    full_type = 'process.calculation.calcfunction.%|aiida.calculations:arithmetic.add'
+    filters = identifiers.get_full_type_filters(full_type)
+    expected = {
+        'node_type': {'like': 'process.calculation.calcfunction.%'},
+        'process_type': {'==': 'aiida.calculations:arithmetic.add'},
+    }
+    assert filters == expected
+
+    filters['id'] = {'>': 1}
+    filters['node_type']['like'] = 'data.%'
+
+    assert identifiers.get_full_type_filters(full_type) == expected
@@ -1,6 +1,8 @@
 """Test that all aiida entity models can be loaded loaded into pydantic models."""
 
+import pytest
 from aiida import orm
+from pydantic import ValidationError
 
 from aiida_restapi import models
 
@@ -46,3 +48,46 @@ def test_group_get_entities(data_regression):
     orm.Group(label='regression_label_1', description='regrerssion_test').store()
     py_group = models.Group.get_entities(order_by=['id'])
     data_regression.check([replace_dynamic(c.dict()) for c in py_group])
+
+
+def test_user_get_entities_after_id():
+    """Test ``User.get_entities`` with keyset pagination."""
+    for email in ('a@b.com', 'c@d.com', 'e@f.com'):
+        orm.User(email=email).store()
+    ids = [user.id for user in models.User.get_entities(order_by=['id'])]
+    py_users = models.User.get_entities(page_size=2, after_id=ids[0])
+    assert [user.id for user in py_users] == ids[1:3]
+    with pytest.raises(ValueError, match='after_id cannot be combined with page'):
+        models.User.get_entities(page_size=2, page=2, after_id=ids[0])
+
+
+def test_node_post_create_new_nodes():
+    """Test ``Node_Post.create_new_nodes`` stores all nodes."""
+    orm_nodes = models.Node_Post.create_new_nodes(orm.Int, [{'attributes': {'value': 1}}, {'attributes': {'value': 2}}])
+    assert all(orm_node.is_stored for orm_node in orm_nodes)
+    assert [orm.load_node(orm_node.pk).value for orm_node in orm_nodes] == [1, 2]
+
+
+def test_get_entities_invalid_projection():
+    """Test ``get_entities`` rejects properties that are not projectable."""
+    with pytest.raises(ValueError, match='projection not subset'):
+        models.User.get_entities(project=['password'])
+    with pytest.raises(ValueError, match='order_by not subset'):
+        models.User.get_entities(order_by=['password'])
+
+
+def test_user_get_entities_partial_projection():
+    """Test ``User.get_entities`` validates projections that miss required fields."""
+    orm.User(email='verdi@opera.net').store()
+    with pytest.raises(ValidationError, match='email'):
+        models.User.get_entities(project=['id'])
+    py_users = models.User.get_entities(project=['email'], order_by=['email'])
+    assert 'verdi@opera.net' in [user.email for user in py_users]
+
+
+def test_node_post_create_new_nodes_rollback():
+    """Test ``Node_Post.create_new_nodes`` stores no node if one of them fails."""
+    node_dicts = [{'label': 'bulk', 'attributes': {'value': 1}}, {'label': 'bulk', 'attributes': {}}]
+    with pytest.raises(KeyError):
+        models.Node_Post.create_new_nodes(orm.Int, node_dicts)
+    assert orm.QueryBuilder().append(orm.Int, filters={'label': 'bulk'}).count() == 0
@@ -4,6 +4,7 @@ import io
 import json
 
 import pytest
+from aiida import orm
 
 
 def test_get_nodes_projectable(client):
@@ -28,6 +29,15 @@ def test_get_nodes_projectable(client):
     ]
 
 
+def test_get_node_wide_integer(client):
+    """Test getting a node with an integer attribute wider than 64 bits."""
+    node = orm.Int(2**70).store()
+    response = client.get(f'/nodes/{node.pk}')
+
+    assert response.status_code == 200
+    assert response.json()['attributes']['value'] == 2**70
+
+
 def test_get_download_formats(client):
     """Test get download formats for nodes."""
     response = client.get('/nodes/download_formats')